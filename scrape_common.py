@@ -0,0 +1,221 @@
+"""
+Shared Scraper Helpers
+======================
+Utilities shared between the individual job scrapers.
+"""
+
+import re
+import sys
+import threading
+from dataclasses import dataclass
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Optional speedup; the regex path works without it
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None  # Optional; without it every run re-downloads
+
+
+@dataclass(slots=True)
+class Job:
+    """
+    One scraped job posting.
+
+    Field names match the exported Excel columns. Slots avoid the
+    per-instance __dict__, which matters once scrapes reach thousands
+    of records.
+    """
+    JobTitle: str = ''
+    Location: str = ''
+    ExperienceRequired: str = ''
+    SkillsRequired: str = ''
+    Salary: str = ''
+    JobURL: str = ''
+    JobDescriptionSummary: str = ''
+
+
+def make_session(cache_name, expire_after=6 * 3600):
+    """
+    Build the shared HTTP session with pooled connections.
+
+    When requests-cache is installed, responses are cached in a local
+    sqlite file so repeated runs skip re-downloading unchanged pages.
+    Pass --no-cache on the command line to force fresh downloads.
+
+    Args:
+        cache_name (str): Base name for the sqlite cache file
+        expire_after (int): Cache entry lifetime in seconds
+
+    Returns:
+        requests.Session: Session with pooling (and caching) configured
+    """
+    if requests_cache is not None and '--no-cache' not in sys.argv:
+        session = requests_cache.CachedSession(
+            cache_name, backend='sqlite', expire_after=expire_after)
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def declared_encoding(response):
+    """
+    Return the charset the server actually declared, or None.
+
+    requests fills response.encoding with a latin-1 default for text/*
+    responses whose Content-Type header names no charset, so trusting
+    it unconditionally mojibakes utf-8 pages. Only a charset explicitly
+    present in the header counts as a declaration; callers should sniff
+    the body (apparent_encoding or bs4) when this returns None.
+
+    Args:
+        response (requests.Response): Response to inspect
+
+    Returns:
+        str or None: Declared encoding, or None if the header had none
+    """
+    if 'charset' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    return None
+
+
+def retry_after_seconds(response, default=5, cap=30):
+    """
+    Parse a throttled response's Retry-After header into a bounded delay.
+
+    Args:
+        response (requests.Response): Response carrying the header
+        default (int): Delay to use when the header is missing or unparsable
+        cap (int): Upper bound on the returned delay in seconds
+
+    Returns:
+        int: Seconds to wait before retrying
+    """
+    try:
+        delay = int(response.headers.get('Retry-After', default))
+    except (TypeError, ValueError):
+        delay = default
+    return min(delay, cap)
+
+
+def normalize_job_url(url):
+    """
+    Normalize a job URL for deduplication.
+
+    Drops the fragment and any trailing slash so links like
+    ``/careers/123/``, ``/careers/123`` and ``/careers/123#apply`` all
+    map to the same key.
+
+    Args:
+        url (str): URL to normalize (may be empty)
+
+    Returns:
+        str: Normalized URL, or the input unchanged if it was empty
+    """
+    if not url:
+        return url
+    parts = urlsplit(url)
+    return urlunsplit(
+        (parts.scheme, parts.netloc, parts.path.rstrip('/'), parts.query, ''))
+
+
+def compile_skill_pattern(skill_keywords):
+    """
+    Build a single compiled regex matching any of the given skill keywords.
+
+    Args:
+        skill_keywords (list): Skill names to match against lowercased text
+
+    Returns:
+        Pattern: Compiled regex whose group(1) is the matched keyword
+    """
+    # Longest keywords first so 'javascript' wins over 'java' and 'node.js'
+    # over 'node'. Lookarounds instead of \b because keywords like 'c++'
+    # and 'c#' end in non-word characters where \b never matches.
+    alternation = '|'.join(
+        re.escape(skill.lower())
+        for skill in sorted(skill_keywords, key=len, reverse=True)
+    )
+    return re.compile(r'(?<!\w)(' + alternation + r')(?!\w)')
+
+
+class SkillMatcher:
+    """
+    Find skill keywords in lowercased text in one pass.
+
+    Uses a pyahocorasick automaton when the package is available - one
+    O(len(text)) scan regardless of keyword count - and falls back to
+    the compiled alternation regex otherwise. Matches are reported in
+    text order, deduplicated, and checked against word boundaries so
+    'go' does not match inside 'google' or 'java' inside 'javascript'.
+    """
+
+    def __init__(self, skill_keywords):
+        self._regex = compile_skill_pattern(skill_keywords)
+        self._automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword in skill_keywords:
+                keyword = keyword.lower()
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def find(self, text_lower):
+        """
+        Return the unique keywords found in the text, in match order.
+
+        Args:
+            text_lower (str): Lowercased text to scan
+
+        Returns:
+            list: Matched keywords, deduplicated
+        """
+        if self._automaton is None:
+            return list(dict.fromkeys(
+                match.group(1) for match in self._regex.finditer(text_lower)))
+
+        found = {}
+        for end, keyword in self._automaton.iter(text_lower):
+            start = end - len(keyword) + 1
+            if self._word_bounded(text_lower, start, end):
+                found.setdefault(keyword)
+        return list(found)
+
+    @staticmethod
+    def _word_bounded(text, start, end):
+        before = text[start - 1] if start > 0 else ' '
+        after = text[end + 1] if end + 1 < len(text) else ' '
+        return (not (before.isalnum() or before == '_')
+                and not (after.isalnum() or after == '_'))
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter shared across worker threads.
+
+    Allows bursts of up to ``burst`` requests, then sustains roughly
+    ``burst / interval`` requests per second: each acquired token is
+    returned to the bucket ``interval`` seconds later.
+    """
+
+    def __init__(self, burst=8, interval=1.0):
+        self._tokens = threading.Semaphore(burst)
+        self._interval = interval
+
+    def acquire(self):
+        """Block until a request token is available."""
+        self._tokens.acquire()
+        timer = threading.Timer(self._interval, self._tokens.release)
+        timer.daemon = True
+        timer.start()
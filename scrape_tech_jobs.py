@@ -1,351 +1,597 @@
-"""
-Tech Company Jobs Scraper - Alternative Approach
-===============================================
-This script attempts to scrape from multiple sources and includes a fallback
-to create realistic sample data demonstrating the scraping framework.
-
-Requirements:
-- requests
-- beautifulsoup4  
-- pandas
-- openpyxl
-
-Usage: python scrape_tech_jobs.py
-"""
-
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import time
-import re
-from urllib.parse import urljoin
-import random
-
-# Configuration
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-    "Accept-Language": "en-US,en;q=0.5",
-    "Accept-Encoding": "gzip, deflate, br",
-    "Connection": "keep-alive",
-    "Upgrade-Insecure-Requests": "1"
-}
-
-
-def generate_sample_jobs():
-    """
-    Generate realistic sample job data for demonstration purposes.
-    This simulates what would be scraped from a real careers page.
-    """
-    
-    job_titles = [
-        "Senior Software Engineer", "Data Scientist", "Product Manager",
-        "DevOps Engineer", "Frontend Developer", "Backend Developer",
-        "Machine Learning Engineer", "Cloud Architect", "UI/UX Designer",
-        "Technical Program Manager", "Site Reliability Engineer",
-        "Security Engineer", "Mobile Developer", "Full Stack Developer",
-        "Data Engineer", "Business Analyst", "QA Engineer",
-        "Principal Software Engineer", "Research Scientist",
-        "Engineering Manager"
-    ]
-    
-    locations = [
-        "Seattle, WA", "San Francisco, CA", "New York, NY", "Austin, TX",
-        "Boston, MA", "Remote", "Chicago, IL", "Los Angeles, CA",
-        "Denver, CO", "Atlanta, GA", "Remote - US", "Portland, OR",
-        "San Jose, CA", "Washington, DC", "Remote - Global"
-    ]
-    
-    experience_levels = [
-        "3+ years", "5+ years", "7+ years", "2-4 years", "Entry level",
-        "Senior level", "10+ years", "4-6 years", "Principal level",
-        "Lead level", "1-3 years", "8+ years"
-    ]
-    
-    skills_sets = [
-        "Python, Django, PostgreSQL, AWS, Docker",
-        "JavaScript, React, Node.js, MongoDB, Git",
-        "Java, Spring Boot, Microservices, Kubernetes, Jenkins",
-        "C#, .NET, Azure, SQL Server, DevOps",
-        "Go, Docker, Kubernetes, Terraform, AWS",
-        "Python, TensorFlow, PyTorch, SQL, Machine Learning",
-        "React, TypeScript, GraphQL, Jest, CSS",
-        "AWS, CloudFormation, Lambda, S3, EC2",
-        "Figma, Sketch, Adobe Creative Suite, Prototyping",
-        "Agile, Scrum, JIRA, Confluence, Leadership",
-        "Linux, Bash, Monitoring, Alerting, SRE",
-        "Cybersecurity, Penetration Testing, SIEM, Compliance",
-        "Swift, iOS, Objective-C, Xcode, App Store",
-        "Angular, Vue.js, HTML5, CSS3, Webpack",
-        "Spark, Hadoop, Airflow, ETL, Data Warehousing",
-        "SQL, Tableau, Power BI, Statistics, Excel",
-        "Selenium, JUnit, TestNG, Automation, Performance Testing",
-        "Architecture, System Design, Scalability, Performance",
-        "Research, Publications, PhD, Algorithm Design",
-        "Team Leadership, Project Management, Strategy"
-    ]
-    
-    descriptions = [
-        "Join our team to build scalable software solutions that impact millions of users worldwide. You'll work with cutting-edge technologies and collaborate with talented engineers.",
-        "We're looking for a passionate data scientist to extract insights from large datasets and build predictive models that drive business decisions.",
-        "Lead product strategy and roadmap for our flagship products. Work closely with engineering, design, and business teams to deliver exceptional user experiences.",
-        "Design and maintain our cloud infrastructure. Implement CI/CD pipelines and ensure high availability of our services.",
-        "Create beautiful and intuitive user interfaces using modern web technologies. Collaborate with designers and backend engineers.",
-        "Build robust backend services and APIs. Work with databases, distributed systems, and ensure high performance and reliability.",
-        "Develop machine learning models and deploy them at scale. Work on computer vision, NLP, and recommendation systems.",
-        "Design cloud architecture for enterprise-scale applications. Focus on security, scalability, and cost optimization.",
-        "Design user-centered experiences for web and mobile applications. Conduct user research and create prototypes.",
-        "Drive technical programs across multiple engineering teams. Ensure successful delivery of complex projects."
-    ]
-    
-    base_urls = [
-        "https://careers.microsoft.com/job/",
-        "https://jobs.google.com/job/",
-        "https://careers.amazon.com/job/",
-        "https://careers.apple.com/job/",
-        "https://careers.netflix.com/job/",
-    ]
-    
-    jobs = []
-    
-    for i in range(25):  # Generate 25 sample jobs
-        job = {
-            'JobTitle': random.choice(job_titles),
-            'Location': random.choice(locations),
-            'ExperienceRequired': random.choice(experience_levels),
-            'SkillsRequired': random.choice(skills_sets),
-            'Salary': "",  # Most companies don't publish salaries
-            'JobURL': f"{random.choice(base_urls)}{1000 + i}",
-            'JobDescriptionSummary': random.choice(descriptions)
-        }
-        jobs.append(job)
-    
-    return jobs
-
-
-def try_scrape_stackoverflow_jobs():
-    """
-    Attempt to scrape from Stack Overflow Jobs (if available).
-    Returns empty list if scraping fails.
-    """
-    try:
-        url = "https://stackoverflow.com/jobs"
-        print(f"Attempting to scrape Stack Overflow Jobs...")
-        
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        jobs = []
-        job_cards = soup.find_all('div', class_='listResults')
-        
-        for card in job_cards[:10]:  # Limit to 10 jobs
-            try:
-                title_elem = card.find('h2')
-                title = title_elem.get_text(strip=True) if title_elem else "Unknown Title"
-                
-                location_elem = card.find('span', class_='fc-black-500')
-                location = location_elem.get_text(strip=True) if location_elem else "Remote"
-                
-                link_elem = card.find('a', href=True)
-                job_url = urljoin(url, link_elem['href']) if link_elem else ""
-                
-                jobs.append({
-                    'JobTitle': title,
-                    'Location': location,
-                    'ExperienceRequired': "",
-                    'SkillsRequired': "",
-                    'Salary': "",
-                    'JobURL': job_url,
-                    'JobDescriptionSummary': ""
-                })
-                
-            except Exception as e:
-                continue
-        
-        return jobs
-        
-    except Exception as e:
-        print(f"Stack Overflow scraping failed: {str(e)}")
-        return []
-
-
-def try_scrape_remoteok():
-    """
-    Attempt to scrape from Remote OK.
-    Returns empty list if scraping fails.
-    """
-    try:
-        url = "https://remoteok.io/remote-dev-jobs"
-        print(f"Attempting to scrape Remote OK...")
-        
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        jobs = []
-        job_rows = soup.find_all('tr', class_='job')
-        
-        for row in job_rows[:15]:  # Limit to 15 jobs
-            try:
-                title_elem = row.find('h2')
-                title = title_elem.get_text(strip=True) if title_elem else "Unknown Title"
-                
-                company_elem = row.find('h3')
-                company = company_elem.get_text(strip=True) if company_elem else "Unknown Company"
-                
-                location = "Remote"  # Remote OK is all remote jobs
-                
-                link_elem = row.find('a', href=True)
-                job_url = urljoin(url, link_elem['href']) if link_elem else ""
-                
-                # Extract skills from tags
-                skill_elems = row.find_all('span', class_='tag')
-                skills = [tag.get_text(strip=True) for tag in skill_elems[:5]]
-                
-                jobs.append({
-                    'JobTitle': f"{title} at {company}",
-                    'Location': location,
-                    'ExperienceRequired': "",
-                    'SkillsRequired': ", ".join(skills),
-                    'Salary': "",
-                    'JobURL': job_url,
-                    'JobDescriptionSummary': ""
-                })
-                
-            except Exception as e:
-                continue
-        
-        return jobs
-        
-    except Exception as e:
-        print(f"Remote OK scraping failed: {str(e)}")
-        return []
-
-
-def save_to_excel(jobs, filename="TechCompany_Jobs.xlsx"):
-    """
-    Save job data to Excel file with proper formatting.
-    """
-    if not jobs:
-        print("No jobs to save!")
-        return
-    
-    try:
-        # Create DataFrame
-        df = pd.DataFrame(jobs)
-        
-        # Ensure all required columns are present
-        required_columns = [
-            'JobTitle', 'Location', 'ExperienceRequired', 
-            'SkillsRequired', 'Salary', 'JobURL', 'JobDescriptionSummary'
-        ]
-        
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = ""
-        
-        # Reorder columns
-        df = df[required_columns]
-        
-        # Clean up data
-        df = df.fillna("")  # Replace NaN with empty strings
-        
-        # Save to Excel without index
-        df.to_excel(filename, index=False, engine='openpyxl')
-        
-        print(f"\n✓ Successfully saved {len(jobs)} jobs to {filename}")
-        
-        # Print summary statistics
-        print(f"\nSummary:")
-        print(f"- Total jobs: {len(jobs)}")
-        print(f"- Jobs with experience info: {len([j for j in jobs if j.get('ExperienceRequired')])}")
-        print(f"- Jobs with skills info: {len([j for j in jobs if j.get('SkillsRequired')])}")
-        print(f"- Jobs with descriptions: {len([j for j in jobs if j.get('JobDescriptionSummary')])}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"Error saving to Excel: {str(e)}")
-        return False
-
-
-def main():
-    """
-    Main function to run the job scraper.
-    """
-    print("=" * 60)
-    print("Tech Company Job Scraper")
-    print("=" * 60)
-    
-    all_jobs = []
-    
-    try:
-        # Test internet connection
-        print("Testing connection...")
-        test_response = requests.get("https://google.com", headers=HEADERS, timeout=5)
-        test_response.raise_for_status()
-        print("✓ Internet connection OK")
-        
-        # Try different scraping sources
-        print("\nAttempting to scrape from multiple sources...")
-        
-        # Try Remote OK
-        remoteok_jobs = try_scrape_remoteok()
-        if remoteok_jobs:
-            all_jobs.extend(remoteok_jobs)
-            print(f"✓ Found {len(remoteok_jobs)} jobs from Remote OK")
-        
-        # Try Stack Overflow
-        so_jobs = try_scrape_stackoverflow_jobs()
-        if so_jobs:
-            all_jobs.extend(so_jobs)
-            print(f"✓ Found {len(so_jobs)} jobs from Stack Overflow")
-        
-        # If no real jobs found, generate sample data
-        if not all_jobs:
-            print("\n⚠️  Real job scraping failed. Generating sample data for demonstration...")
-            sample_jobs = generate_sample_jobs()
-            all_jobs.extend(sample_jobs)
-            print(f"✓ Generated {len(sample_jobs)} sample jobs")
-        
-        if all_jobs:
-            # Save to Excel
-            success = save_to_excel(all_jobs, "TechCompany_Jobs.xlsx")
-            
-            if success:
-                # Display sample jobs
-                print(f"\nSample of scraped/generated jobs:")
-                print("-" * 50)
-                for i, job in enumerate(all_jobs[:5]):
-                    print(f"{i+1}. {job['JobTitle']}")
-                    print(f"   Location: {job['Location']}")
-                    print(f"   Skills: {job['SkillsRequired'][:50]}..." if job['SkillsRequired'] else "   Skills: Not specified")
-                    print(f"   Experience: {job['ExperienceRequired']}")
-                    print()
-                
-                print(f"\n🎉 Successfully created TechCompany_Jobs.xlsx with {len(all_jobs)} job listings!")
-                print("\nThis file demonstrates the complete job scraping framework with:")
-                print("✓ All required columns: JobTitle, Location, ExperienceRequired, SkillsRequired, Salary, JobURL, JobDescriptionSummary")
-                print("✓ Proper data structure and formatting")
-                print("✓ Error handling for missing data")
-                print("✓ Excel export functionality")
-            
-        else:
-            print("❌ No jobs could be scraped or generated.")
-            
-    except requests.RequestException as e:
-        print(f"❌ Network error: {str(e)}")
-        print("Generating sample data for offline demonstration...")
-        sample_jobs = generate_sample_jobs()
-        save_to_excel(sample_jobs, "TechCompany_Jobs.xlsx")
-        
-    except Exception as e:
-        print(f"❌ Unexpected error: {str(e)}")
-        print("Generating sample data as fallback...")
-        sample_jobs = generate_sample_jobs()
-        save_to_excel(sample_jobs, "TechCompany_Jobs.xlsx")
-
-
-if __name__ == "__main__":
-    main()
+"""
+Tech Company Jobs Scraper - Alternative Approach
+===============================================
+This script attempts to scrape from multiple sources and includes a fallback
+to create realistic sample data demonstrating the scraping framework.
+
+Requirements:
+- requests
+- beautifulsoup4
+- numpy
+- pandas
+- openpyxl
+- lxml
+- selectolax (optional, faster parsing)
+- requests-cache (optional, on-disk response caching)
+
+Usage: python scrape_tech_jobs.py
+"""
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+from openpyxl import Workbook
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from urllib.parse import urljoin
+import atexit
+import socket
+import random
+
+from scrape_common import declared_encoding, make_session
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None  # Fall back to lxml/BeautifulSoup parsing
+
+try:
+    from lxml import html as lxml_html
+    import cssselect  # noqa: F401 - Element.cssselect needs it installed
+except ImportError:
+    lxml_html = None  # Fall back to BeautifulSoup parsing
+
+# Tuned parser for the lxml fallback tier: skip comment nodes, blank
+# text nodes and the document id index, none of which the selectors
+# below ever look at. Allocated once and reused across fetches.
+if lxml_html is not None:
+    _LXML_PARSER = lxml_html.HTMLParser(
+        remove_blank_text=True, remove_comments=True, collect_ids=False)
+
+# Strainers for the BeautifulSoup fallback: only the job cards survive
+# tree construction, so the parser skips the nav/script/ad bulk of the
+# page entirely
+_SO_STRAINER = SoupStrainer('div', class_='listResults')
+_REMOTEOK_STRAINER = SoupStrainer('tr', class_='job')
+
+# Configuration
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1"
+}
+
+# Shared session so every fetch reuses pooled TCP+TLS connections
+# instead of paying a fresh handshake per request. With requests-cache
+# installed, responses land in an on-disk cache with a 15-minute TTL so
+# back-to-back runs skip the network entirely (--no-cache overrides).
+SESSION = make_session('tech_jobs_cache', expire_after=900)
+SESSION.headers.update(HEADERS)
+atexit.register(SESSION.close)
+
+# Status codes worth retrying: throttling and transient server errors
+_RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+# Cap on how much of a listings page is downloaded; the job cards sit
+# well within the first half megabyte and anything past that is footer
+_MAX_PAGE_BYTES = 512 * 1024
+
+# Output columns, in export order
+REQUIRED_COLUMNS = (
+    'JobTitle', 'Location', 'ExperienceRequired',
+    'SkillsRequired', 'Salary', 'JobURL', 'JobDescriptionSummary'
+)
+
+
+def new_job_columns():
+    """
+    Create an empty column buffer: one list per required column.
+
+    Jobs are accumulated column-wise rather than as a list of per-job
+    dicts, so the DataFrame can be built straight from the buffers with
+    no per-row dict allocation, dtype inference or fillna pass.
+    """
+    return {col: [] for col in REQUIRED_COLUMNS}
+
+
+def append_job(cols, **fields):
+    """
+    Append one job to a column buffer; unspecified fields become "".
+    """
+    for col in REQUIRED_COLUMNS:
+        cols[col].append(fields.get(col, ""))
+
+
+def extend_job_columns(cols, more):
+    """
+    Extend one column buffer with the contents of another.
+    """
+    for col in REQUIRED_COLUMNS:
+        cols[col].extend(more[col])
+
+
+def _fetch_html(url):
+    """
+    Fetch a listings page body, streaming at most _MAX_PAGE_BYTES.
+
+    Streaming starts parsing-side work as soon as the headers arrive
+    and cuts the transfer off at the cap instead of buffering
+    arbitrarily large pages in full before any parsing happens.
+
+    Returns:
+        tuple: (page body bytes truncated at the cap, declared encoding)
+
+    The encoding is the charset the Content-Type header actually named,
+    or None when the server declared nothing - in which case parsers
+    should sniff the body themselves rather than assume a default.
+    """
+    response = _get_with_retry(url, stream=True)
+    response.raise_for_status()
+    with response:
+        content = response.raw.read(_MAX_PAGE_BYTES, decode_content=True)
+    return content, declared_encoding(response)
+
+
+def _get_with_retry(url, max_retries=3, base_delay=1.0, cap=30.0, timeout=10,
+                    stream=False):
+    """
+    GET a URL, retrying transient failures with exponential backoff.
+    
+    Timeouts, connection errors and retryable status codes (429/5xx)
+    are retried up to max_retries times, sleeping
+    base_delay * 2**attempt * (0.5 + random()) seconds between attempts
+    (never more than cap). A 429 carrying a numeric Retry-After header
+    sleeps for the server-requested delay instead. Other 4xx responses
+    are returned as-is for the caller's raise_for_status.
+    """
+    for attempt in range(max_retries):
+        try:
+            response = SESSION.get(url, timeout=timeout, stream=stream)
+        except requests.RequestException:
+            if attempt == max_retries - 1:
+                raise
+            response = None
+        else:
+            if response.status_code not in _RETRYABLE_STATUSES:
+                return response
+            if attempt == max_retries - 1:
+                return response
+        
+        # Exponential backoff with jitter; a throttling server may name
+        # its own delay
+        delay = min(cap, base_delay * 2 ** attempt * (0.5 + random.random()))
+        if response is not None and response.status_code == 429:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = min(cap, int(retry_after))
+        time.sleep(delay)
+
+
+def generate_sample_jobs():
+    """
+    Generate realistic sample job data for demonstration purposes.
+    This simulates what would be scraped from a real careers page.
+    """
+    
+    job_titles = [
+        "Senior Software Engineer", "Data Scientist", "Product Manager",
+        "DevOps Engineer", "Frontend Developer", "Backend Developer",
+        "Machine Learning Engineer", "Cloud Architect", "UI/UX Designer",
+        "Technical Program Manager", "Site Reliability Engineer",
+        "Security Engineer", "Mobile Developer", "Full Stack Developer",
+        "Data Engineer", "Business Analyst", "QA Engineer",
+        "Principal Software Engineer", "Research Scientist",
+        "Engineering Manager"
+    ]
+    
+    locations = [
+        "Seattle, WA", "San Francisco, CA", "New York, NY", "Austin, TX",
+        "Boston, MA", "Remote", "Chicago, IL", "Los Angeles, CA",
+        "Denver, CO", "Atlanta, GA", "Remote - US", "Portland, OR",
+        "San Jose, CA", "Washington, DC", "Remote - Global"
+    ]
+    
+    experience_levels = [
+        "3+ years", "5+ years", "7+ years", "2-4 years", "Entry level",
+        "Senior level", "10+ years", "4-6 years", "Principal level",
+        "Lead level", "1-3 years", "8+ years"
+    ]
+    
+    skills_sets = [
+        "Python, Django, PostgreSQL, AWS, Docker",
+        "JavaScript, React, Node.js, MongoDB, Git",
+        "Java, Spring Boot, Microservices, Kubernetes, Jenkins",
+        "C#, .NET, Azure, SQL Server, DevOps",
+        "Go, Docker, Kubernetes, Terraform, AWS",
+        "Python, TensorFlow, PyTorch, SQL, Machine Learning",
+        "React, TypeScript, GraphQL, Jest, CSS",
+        "AWS, CloudFormation, Lambda, S3, EC2",
+        "Figma, Sketch, Adobe Creative Suite, Prototyping",
+        "Agile, Scrum, JIRA, Confluence, Leadership",
+        "Linux, Bash, Monitoring, Alerting, SRE",
+        "Cybersecurity, Penetration Testing, SIEM, Compliance",
+        "Swift, iOS, Objective-C, Xcode, App Store",
+        "Angular, Vue.js, HTML5, CSS3, Webpack",
+        "Spark, Hadoop, Airflow, ETL, Data Warehousing",
+        "SQL, Tableau, Power BI, Statistics, Excel",
+        "Selenium, JUnit, TestNG, Automation, Performance Testing",
+        "Architecture, System Design, Scalability, Performance",
+        "Research, Publications, PhD, Algorithm Design",
+        "Team Leadership, Project Management, Strategy"
+    ]
+    
+    descriptions = [
+        "Join our team to build scalable software solutions that impact millions of users worldwide. You'll work with cutting-edge technologies and collaborate with talented engineers.",
+        "We're looking for a passionate data scientist to extract insights from large datasets and build predictive models that drive business decisions.",
+        "Lead product strategy and roadmap for our flagship products. Work closely with engineering, design, and business teams to deliver exceptional user experiences.",
+        "Design and maintain our cloud infrastructure. Implement CI/CD pipelines and ensure high availability of our services.",
+        "Create beautiful and intuitive user interfaces using modern web technologies. Collaborate with designers and backend engineers.",
+        "Build robust backend services and APIs. Work with databases, distributed systems, and ensure high performance and reliability.",
+        "Develop machine learning models and deploy them at scale. Work on computer vision, NLP, and recommendation systems.",
+        "Design cloud architecture for enterprise-scale applications. Focus on security, scalability, and cost optimization.",
+        "Design user-centered experiences for web and mobile applications. Conduct user research and create prototypes.",
+        "Drive technical programs across multiple engineering teams. Ensure successful delivery of complex projects."
+    ]
+    
+    base_urls = [
+        "https://careers.microsoft.com/job/",
+        "https://jobs.google.com/job/",
+        "https://careers.amazon.com/job/",
+        "https://careers.apple.com/job/",
+        "https://careers.netflix.com/job/",
+    ]
+    
+    count = 25  # Generate 25 sample jobs
+
+    # Sample each column with one vectorized rng.choice call; object
+    # dtype keeps the values as plain Python strings, and tolist()
+    # preserves the columnar list-buffer contract for the callers
+    rng = np.random.default_rng()
+
+    def pick(values):
+        return rng.choice(np.array(values, dtype=object), size=count).tolist()
+
+    return {
+        'JobTitle': pick(job_titles),
+        'Location': pick(locations),
+        'ExperienceRequired': pick(experience_levels),
+        'SkillsRequired': pick(skills_sets),
+        'Salary': [""] * count,  # Most companies don't publish salaries
+        'JobURL': [f"{base}{1000 + i}"
+                   for i, base in enumerate(pick(base_urls))],
+        'JobDescriptionSummary': pick(descriptions)
+    }
+
+
+def try_scrape_stackoverflow_jobs():
+    """
+    Attempt to scrape from Stack Overflow Jobs (if available).
+    Returns an empty column buffer if scraping fails.
+    """
+    try:
+        url = "https://stackoverflow.com/jobs"
+        print(f"Attempting to scrape Stack Overflow Jobs...")
+
+        content, encoding = _fetch_html(url)
+
+        cols = new_job_columns()
+
+        if LexborHTMLParser is not None:
+            # Fast path: Lexbor keeps the whole tree in C and hands back
+            # only the nodes we ask for, with no Python node wrappers
+            tree = LexborHTMLParser(content)
+            for card in tree.css('div.listResults')[:10]:  # Limit to 10 jobs
+                try:
+                    title_elem = card.css_first('h2')
+                    title = title_elem.text(strip=True) if title_elem is not None else "Unknown Title"
+                    
+                    location_elem = card.css_first('span.fc-black-500')
+                    location = location_elem.text(strip=True) if location_elem is not None else "Remote"
+                    
+                    link_elem = card.css_first('a[href]')
+                    job_url = urljoin(url, link_elem.attributes.get('href') or "") if link_elem is not None else ""
+
+                    append_job(cols, JobTitle=title, Location=location,
+                               JobURL=job_url)
+
+                except Exception as e:
+                    continue
+
+            return cols
+        
+        if lxml_html is not None:
+            # Middle tier: lxml with the tuned parser and css selectors
+            root = lxml_html.fromstring(content, parser=_LXML_PARSER)
+            for card in root.cssselect('div.listResults')[:10]:  # Limit to 10 jobs
+                try:
+                    title_elems = card.cssselect('h2')
+                    title = title_elems[0].text_content().strip() if title_elems else "Unknown Title"
+
+                    location_elems = card.cssselect('span.fc-black-500')
+                    location = location_elems[0].text_content().strip() if location_elems else "Remote"
+
+                    link_elems = card.cssselect('a[href]')
+                    job_url = urljoin(url, link_elems[0].get('href')) if link_elems else ""
+
+                    append_job(cols, JobTitle=title, Location=location,
+                               JobURL=job_url)
+
+                except Exception as e:
+                    continue
+
+            return cols
+
+        # Fallback: BeautifulSoup when neither selectolax nor cssselect
+        # is installed
+        soup = BeautifulSoup(content, 'lxml', from_encoding=encoding,
+                             parse_only=_SO_STRAINER)
+        job_cards = soup.find_all('div', class_='listResults')
+        
+        for card in job_cards[:10]:  # Limit to 10 jobs
+            try:
+                title_elem = card.find('h2')
+                title = title_elem.get_text(strip=True) if title_elem else "Unknown Title"
+                
+                location_elem = card.find('span', class_='fc-black-500')
+                location = location_elem.get_text(strip=True) if location_elem else "Remote"
+                
+                link_elem = card.find('a', href=True)
+                job_url = urljoin(url, link_elem['href']) if link_elem else ""
+
+                append_job(cols, JobTitle=title, Location=location,
+                           JobURL=job_url)
+
+            except Exception as e:
+                continue
+
+        return cols
+
+    except Exception as e:
+        print(f"Stack Overflow scraping failed: {str(e)}")
+        return new_job_columns()
+
+
+def try_scrape_remoteok():
+    """
+    Attempt to scrape from Remote OK.
+    Returns an empty column buffer if scraping fails.
+    """
+    try:
+        url = "https://remoteok.io/remote-dev-jobs"
+        print(f"Attempting to scrape Remote OK...")
+
+        content, encoding = _fetch_html(url)
+
+        cols = new_job_columns()
+
+        if LexborHTMLParser is not None:
+            # Fast path: Lexbor keeps the whole tree in C and hands back
+            # only the nodes we ask for, with no Python node wrappers
+            tree = LexborHTMLParser(content)
+            for row in tree.css('tr.job')[:15]:  # Limit to 15 jobs
+                try:
+                    title_elem = row.css_first('h2')
+                    title = title_elem.text(strip=True) if title_elem is not None else "Unknown Title"
+                    
+                    company_elem = row.css_first('h3')
+                    company = company_elem.text(strip=True) if company_elem is not None else "Unknown Company"
+                    
+                    location = "Remote"  # Remote OK is all remote jobs
+                    
+                    link_elem = row.css_first('a[href]')
+                    job_url = urljoin(url, link_elem.attributes.get('href') or "") if link_elem is not None else ""
+                    
+                    # Extract skills from tags
+                    skills = [tag.text(strip=True) for tag in row.css('span.tag')[:5]]
+
+                    append_job(cols, JobTitle=f"{title} at {company}",
+                               Location=location,
+                               SkillsRequired=", ".join(skills),
+                               JobURL=job_url)
+
+                except Exception as e:
+                    continue
+
+            return cols
+        
+        if lxml_html is not None:
+            # Middle tier: lxml with the tuned parser and css selectors
+            root = lxml_html.fromstring(content, parser=_LXML_PARSER)
+            for row in root.cssselect('tr.job')[:15]:  # Limit to 15 jobs
+                try:
+                    title_elems = row.cssselect('h2')
+                    title = title_elems[0].text_content().strip() if title_elems else "Unknown Title"
+
+                    company_elems = row.cssselect('h3')
+                    company = company_elems[0].text_content().strip() if company_elems else "Unknown Company"
+
+                    location = "Remote"  # Remote OK is all remote jobs
+
+                    link_elems = row.cssselect('a[href]')
+                    job_url = urljoin(url, link_elems[0].get('href')) if link_elems else ""
+
+                    # Extract skills from tags
+                    skills = [tag.text_content().strip() for tag in row.cssselect('span.tag')[:5]]
+
+                    append_job(cols, JobTitle=f"{title} at {company}",
+                               Location=location,
+                               SkillsRequired=", ".join(skills),
+                               JobURL=job_url)
+
+                except Exception as e:
+                    continue
+
+            return cols
+
+        # Fallback: BeautifulSoup when neither selectolax nor cssselect
+        # is installed
+        soup = BeautifulSoup(content, 'lxml', from_encoding=encoding,
+                             parse_only=_REMOTEOK_STRAINER)
+        job_rows = soup.find_all('tr', class_='job')
+        
+        for row in job_rows[:15]:  # Limit to 15 jobs
+            try:
+                title_elem = row.find('h2')
+                title = title_elem.get_text(strip=True) if title_elem else "Unknown Title"
+                
+                company_elem = row.find('h3')
+                company = company_elem.get_text(strip=True) if company_elem else "Unknown Company"
+                
+                location = "Remote"  # Remote OK is all remote jobs
+                
+                link_elem = row.find('a', href=True)
+                job_url = urljoin(url, link_elem['href']) if link_elem else ""
+                
+                # Extract skills from tags
+                skill_elems = row.find_all('span', class_='tag')
+                skills = [tag.get_text(strip=True) for tag in skill_elems[:5]]
+
+                append_job(cols, JobTitle=f"{title} at {company}",
+                           Location=location,
+                           SkillsRequired=", ".join(skills),
+                           JobURL=job_url)
+
+            except Exception as e:
+                continue
+
+        return cols
+
+    except Exception as e:
+        print(f"Remote OK scraping failed: {str(e)}")
+        return new_job_columns()
+
+
+def save_to_excel(cols, filename="TechCompany_Jobs.xlsx"):
+    """
+    Save a job column buffer to an Excel file with proper formatting.
+    """
+    total = len(cols['JobTitle'])
+    if not total:
+        print("No jobs to save!")
+        return
+
+    try:
+        # The buffers are already complete and ordered, so the DataFrame
+        # needs no column reindex and no fillna pass
+        df = pd.DataFrame(cols, columns=list(REQUIRED_COLUMNS))
+
+        # Stream rows to disk through a write-only workbook rather than
+        # letting df.to_excel build the whole workbook tree in memory
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet('Jobs')
+        ws.append(REQUIRED_COLUMNS)
+        for row in df.itertuples(index=False, name=None):
+            ws.append(row)
+        wb.save(filename)
+
+        print(f"\n✓ Successfully saved {total} jobs to {filename}")
+
+        # Print summary statistics; one vectorized pass counts the
+        # non-empty cells for all three columns at once
+        filled = (df[['ExperienceRequired', 'SkillsRequired',
+                      'JobDescriptionSummary']] != "").sum()
+        print(f"\nSummary:")
+        print(f"- Total jobs: {total}")
+        print(f"- Jobs with experience info: {filled['ExperienceRequired']}")
+        print(f"- Jobs with skills info: {filled['SkillsRequired']}")
+        print(f"- Jobs with descriptions: {filled['JobDescriptionSummary']}")
+
+        return True
+
+    except Exception as e:
+        print(f"Error saving to Excel: {str(e)}")
+        return False
+
+
+def main():
+    """
+    Main function to run the job scraper.
+    """
+    print("=" * 60)
+    print("Tech Company Job Scraper")
+    print("=" * 60)
+    
+    all_cols = new_job_columns()
+
+    try:
+        # Test internet connection with a bare TCP handshake - same
+        # signal as fetching google.com without the TLS+HTTP round trips
+        print("Testing connection...")
+        try:
+            socket.create_connection(('1.1.1.1', 443), timeout=2).close()
+        except OSError as e:
+            raise requests.RequestException(f"No connectivity: {e}")
+        print("✓ Internet connection OK")
+        
+        # Try different scraping sources
+        print("\nAttempting to scrape from multiple sources...")
+        
+        # The sources are independent network calls, so run them
+        # concurrently: total wait is max(latencies) instead of the sum.
+        # Plain threads suffice - the GIL is released during socket reads
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                executor.submit(try_scrape_remoteok): "Remote OK",
+                executor.submit(try_scrape_stackoverflow_jobs): "Stack Overflow",
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    source_cols = future.result()
+                except Exception:
+                    continue
+                if source_cols['JobTitle']:
+                    extend_job_columns(all_cols, source_cols)
+                    print(f"✓ Found {len(source_cols['JobTitle'])} jobs from {source}")
+
+        # If no real jobs found, generate sample data
+        if not all_cols['JobTitle']:
+            print("\n⚠️  Real job scraping failed. Generating sample data for demonstration...")
+            sample_cols = generate_sample_jobs()
+            extend_job_columns(all_cols, sample_cols)
+            print(f"✓ Generated {len(sample_cols['JobTitle'])} sample jobs")
+
+        total_jobs = len(all_cols['JobTitle'])
+        if total_jobs:
+            # Save to Excel
+            success = save_to_excel(all_cols, "TechCompany_Jobs.xlsx")
+
+            if success:
+                # Display sample jobs
+                print(f"\nSample of scraped/generated jobs:")
+                print("-" * 50)
+                for i in range(min(5, total_jobs)):
+                    skills = all_cols['SkillsRequired'][i]
+                    print(f"{i+1}. {all_cols['JobTitle'][i]}")
+                    print(f"   Location: {all_cols['Location'][i]}")
+                    print(f"   Skills: {skills[:50]}..." if skills else "   Skills: Not specified")
+                    print(f"   Experience: {all_cols['ExperienceRequired'][i]}")
+                    print()
+
+                print(f"\n🎉 Successfully created TechCompany_Jobs.xlsx with {total_jobs} job listings!")
+                print("\nThis file demonstrates the complete job scraping framework with:")
+                print("✓ All required columns: JobTitle, Location, ExperienceRequired, SkillsRequired, Salary, JobURL, JobDescriptionSummary")
+                print("✓ Proper data structure and formatting")
+                print("✓ Error handling for missing data")
+                print("✓ Excel export functionality")
+            
+        else:
+            print("❌ No jobs could be scraped or generated.")
+            
+    except requests.RequestException as e:
+        print(f"❌ Network error: {str(e)}")
+        print("Generating sample data for offline demonstration...")
+        save_to_excel(generate_sample_jobs(), "TechCompany_Jobs.xlsx")
+        
+    except Exception as e:
+        print(f"❌ Unexpected error: {str(e)}")
+        print("Generating sample data as fallback...")
+        save_to_excel(generate_sample_jobs(), "TechCompany_Jobs.xlsx")
+
+
+if __name__ == "__main__":
+    main()